@@ -0,0 +1,62 @@
+######################################################################
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+"""
+pytest configuration for the test suite
+
+The tests can be spread across CPU cores with pytest-xdist:
+    pytest -n auto
+
+Each xdist worker gets its own, freshly created PostgreSQL schema so
+that tests running in parallel never see each other's rows. The app and
+its tables are set up once per session by the _db fixture.
+"""
+import os
+import pytest
+from sqlalchemy import create_engine, text
+from tests import DATABASE_URI, init_test_db
+
+
+def worker_database_uri(database_uri: str, worker: str) -> str:
+    """Returns the database URI with the search_path set to the worker's schema"""
+    separator = "&" if "?" in database_uri else "?"
+    return f"{database_uri}{separator}options=-csearch_path%3Dtest_{worker}"
+
+
+def pytest_configure():
+    """Points this xdist worker at its own schema before any test module is imported"""
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker:
+        return
+    if not DATABASE_URI.startswith("postgresql"):
+        # Without per-worker schemas every worker would share one database
+        raise pytest.UsageError("Running tests in parallel requires a PostgreSQL DATABASE_URI")
+    engine = create_engine(DATABASE_URI)
+    with engine.begin() as connection:
+        # Recreate the schema so rows committed by a previous run are gone
+        connection.execute(text(f"DROP SCHEMA IF EXISTS test_{worker} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA test_{worker}"))
+    engine.dispose()
+    os.environ["DATABASE_URI"] = worker_database_uri(DATABASE_URI, worker)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _db():
+    """Configures the app and creates the tables once for the whole session"""
+    from service.models import db  # pylint: disable=import-outside-toplevel
+
+    init_test_db()
+    yield
+    db.session.close()
@@ -19,18 +19,24 @@ Test Factory to make fake objects for testing
 """
 import factory
 from factory.fuzzy import FuzzyChoice, FuzzyDecimal
-from service.models import Product, Category
+from service.models import Product, Category, db
 
 
-class ProductFactory(factory.Factory):
-    """Creates fake products for testing"""
+class ProductFactory(factory.alchemy.SQLAlchemyModelFactory):
+    """Creates fake products for testing
+
+    ProductFactory() adds the product to the session and flushes it so it
+    gets an id without committing. Use ProductFactory.build() for products
+    that must stay out of the database.
+    """
 
     class Meta:
         """Maps factory to data model"""
 
         model = Product
+        sqlalchemy_session = db.session
+        sqlalchemy_session_persistence = "flush"
 
-    id = factory.Sequence(lambda n: n)
     name = FuzzyChoice(choices=["Computer", "Cellphone", "Echo Dot", "Steam Deck", "Car"])
     description = factory.Faker("text")
     price = FuzzyDecimal(0.0, 1000.00)